@@ -18,7 +18,7 @@ from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import DATA_VIEW_REGISTERED, DOMAIN
 from .hikvision_device import HikvisionDevice
 from .isapi import ISAPIUnauthorizedError
 from .notifications import EventNotificationsView
@@ -70,8 +70,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: HikvisionConfigEntry) ->
     device.pending_initialization = False
 
     # Only initialise view once if multiple instances of integration
-    if get_first_instance_unique_id(hass) == entry.unique_id:
+    if not hass.data.get(DATA_VIEW_REGISTERED) and get_first_instance_unique_id(hass) == entry.unique_id:
         hass.http.register_view(EventNotificationsView(hass))
+        hass.data[DATA_VIEW_REGISTERED] = True
 
     refresh_disabled_entities_in_registry(hass, device)
 
@@ -91,26 +92,29 @@ async def async_remove_config_entry_device(hass: HomeAssistant, config_entry, de
 async def async_unload_entry(hass: HomeAssistant, entry: HikvisionConfigEntry) -> bool:
     """Unload a config entry."""
 
-    # Unload a config entry
-    unload_ok = all(
-        await asyncio.gather(
-            *[hass.config_entries.async_forward_entry_unload(entry, platform) for platform in PLATFORMS]
-        )
-    )
-
-    # Reset alarm server after it has been set
     device = entry.runtime_data
+    unload_tasks = [hass.config_entries.async_forward_entry_unload(entry, platform) for platform in PLATFORMS]
+
+    # Reset alarm server after it has been set, runs along with platforms unloading
     if device.control_alarm_server_host:
-        with suppress(Exception):
-            await device.set_alarm_server("http://0.0.0.0:80", "/")
+        unload_tasks.append(reset_alarm_server(device))
 
-    return unload_ok
+    results = await asyncio.gather(*unload_tasks)
+    return all(results[: len(PLATFORMS)])
 
 
-def get_first_instance_unique_id(hass: HomeAssistant) -> int:
+async def reset_alarm_server(device: HikvisionDevice) -> None:
+    """Reset alarm server, device response does not affect unloading."""
+    with suppress(Exception):
+        await device.set_alarm_server("http://0.0.0.0:80", "/")
+
+
+def get_first_instance_unique_id(hass: HomeAssistant) -> str | None:
     """Get entry unique_id for first instance of integration."""
-    entry = [entry for entry in hass.config_entries.async_entries(DOMAIN) if not entry.disabled_by][0]
-    return entry.unique_id
+    return next(
+        (entry.unique_id for entry in hass.config_entries.async_entries(DOMAIN) if not entry.disabled_by),
+        None,
+    )
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
@@ -159,7 +163,7 @@ def refresh_disabled_entities_in_registry(hass: HomeAssistant, device: Hikvision
 
     def update_entity(event, ENTITY_ID_FORMAT):
         entity_id = ENTITY_ID_FORMAT.format(event.unique_id)
-        entity = entity_registry.async_get(entity_id)
+        entity = entities.get(entity_id)
         if not entity:
             return
         if entity.disabled != event.disabled:
@@ -167,6 +171,10 @@ def refresh_disabled_entities_in_registry(hass: HomeAssistant, device: Hikvision
             entity_registry.async_update_entity(entity_id, disabled_by=disabled_by)
 
     entity_registry = er.async_get(hass)
+    entities = {
+        entity.entity_id: entity
+        for entity in er.async_entries_for_config_entry(entity_registry, device.entry.entry_id)
+    }
     for camera in device.cameras:
         for event in camera.events_info:
             update_entity(event, SWITCH_ENTITY_ID_FORMAT)
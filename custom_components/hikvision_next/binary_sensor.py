@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from homeassistant.components.binary_sensor import ENTITY_ID_FORMAT, BinarySensorEntity
-from homeassistant.core import HomeAssistant
+from datetime import datetime
+
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from . import HikvisionConfigEntry
 from .const import EVENTS
@@ -12,6 +16,9 @@ from .hikvision_device import HikvisionDevice
 from .isapi import EventInfo
 from .isapi.const import EVENT_IO
 
+# seconds after the last event alert to turn the sensor off
+ALERT_RESET_DELAY = 5
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,12 +33,12 @@ async def async_setup_entry(
 
     # Video Events
     for camera in device.cameras:
-        for event in camera.events_info:
-            entities.append(EventBinarySensor(device, camera.id, event))
+        device_info = device.hass_device_info(camera.id)
+        entities.extend(EventBinarySensor(device, device_info, event) for event in camera.events_info)
 
     # General Events
-    for event in device.events_info:
-        entities.append(EventBinarySensor(device, 0, event))
+    device_info = device.hass_device_info()
+    entities.extend(EventBinarySensor(device, device_info, event) for event in device.events_info)
 
     async_add_entities(entities)
 
@@ -41,14 +48,49 @@ class EventBinarySensor(BinarySensorEntity):
 
     _attr_has_entity_name = True
     _attr_is_on = False
+    # state changes are pushed by event alerts
+    _attr_should_poll = False
+    _reset_handle: CALLBACK_TYPE | None = None
 
-    def __init__(self, device: HikvisionDevice, device_id: int, event: EventInfo) -> None:
+    def __init__(self, device: HikvisionDevice, device_info: DeviceInfo, event: EventInfo) -> None:
         """Initialize."""
-        self.entity_id = ENTITY_ID_FORMAT.format(event.unique_id)
+        self.entity_id = f"binary_sensor.{event.unique_id}"
         self._attr_unique_id = self.entity_id
         self._attr_translation_key = event.id
         if event.id == EVENT_IO:
             self._attr_translation_placeholders = {"io_port_id": event.io_port_id}
-        self._attr_device_class = EVENTS[event.id]["device_class"]
-        self._attr_device_info = device.hass_device_info(device_id)
-        self._attr_entity_registry_enabled_default = not event.disabled
+        self._attr_device_class = EVENTS[event.id].device_class
+        self._attr_device_info = device_info
+        if event.disabled:
+            self._attr_entity_registry_enabled_default = False
+        self.device = device
+
+    async def async_added_to_hass(self) -> None:
+        """Register sensor to receive event alerts."""
+        self.device.event_sensors[self.unique_id] = self
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister sensor from event alerts."""
+        self.device.event_sensors.pop(self.unique_id, None)
+        if self._reset_handle:
+            self._reset_handle()
+            self._reset_handle = None
+
+    @callback
+    def trigger(self) -> None:
+        """Turn on sensor on incoming event alert, repeated alerts only postpone turning it off."""
+        if self._reset_handle:
+            self._reset_handle()
+        else:
+            self._attr_is_on = True
+            self.async_write_ha_state()
+        self._reset_handle = async_call_later(
+            self.hass, ALERT_RESET_DELAY, HassJob(self._async_reset, cancel_on_shutdown=True)
+        )
+
+    @callback
+    def _async_reset(self, _now: datetime) -> None:
+        """Turn off sensor when no more alerts came."""
+        self._reset_handle = None
+        self._attr_is_on = False
+        self.async_write_ha_state()
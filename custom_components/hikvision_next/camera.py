@@ -5,7 +5,6 @@ from __future__ import annotations
 from homeassistant.components.camera import Camera, CameraEntityFeature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util import slugify
 
 from . import HikvisionConfigEntry
 from .hikvision_device import HikvisionDevice
@@ -19,18 +18,26 @@ async def async_setup_entry(
 
     device = entry.runtime_data
 
-    entities = []
-    for camera in device.cameras:
-        for stream in camera.streams:
-            entities.append(HikvisionCamera(device, camera, stream))
-
-    async_add_entities(entities)
+    # main streams first, other streams are disabled by default
+    async_add_entities(
+        HikvisionCamera(device, camera, stream)
+        for camera in device.cameras
+        for stream in camera.streams
+        if stream.type_id == 1
+    )
+    async_add_entities(
+        HikvisionCamera(device, camera, stream)
+        for camera in device.cameras
+        for stream in camera.streams
+        if stream.type_id > 1
+    )
 
 
 class HikvisionCamera(Camera):
     """An implementation of a Hikvision IP camera."""
 
     _attr_supported_features: CameraEntityFeature = CameraEntityFeature.STREAM
+    _stream_source: str | None = None
 
     def __init__(
         self,
@@ -42,7 +49,7 @@ class HikvisionCamera(Camera):
         Camera.__init__(self)
 
         self._attr_device_info = device.hass_device_info(camera.id)
-        self._attr_unique_id = slugify(f"{device.device_info.serial_no.lower()}_{stream_info.id}")
+        self._attr_unique_id = f"{device.serial_no_slug}_{stream_info.id}"
         if stream_info.type_id > 1:
             self._attr_has_entity_name = True
             self._attr_translation_key = f"stream{stream_info.type_id}"
@@ -56,7 +63,10 @@ class HikvisionCamera(Camera):
 
     async def stream_source(self) -> str | None:
         """Return the source of the stream."""
-        return self.device.get_stream_source(self.stream_info)
+        # credentials and address change only with reconfigure, which reloads entities
+        if self._stream_source is None:
+            self._stream_source = self.device.get_stream_source(self.stream_info)
+        return self._stream_source
 
     async def async_camera_image(self, width: int | None = None, height: int | None = None) -> bytes | None:
         """Return a still image response from the camera."""
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Mapping
 import logging
 from typing import Any
+from urllib.parse import urlsplit, urlunsplit
 
 import voluptuous as vol
 
@@ -29,35 +30,54 @@ from .isapi import ISAPIForbiddenError, ISAPIUnauthorizedError
 
 _LOGGER = logging.getLogger(__name__)
 
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST, default="http://"): str,
+        vol.Optional(CONF_VERIFY_SSL, default=True): bool,
+        vol.Required(CONF_USERNAME): str,
+        vol.Required(CONF_PASSWORD): str,
+        vol.Required(CONF_SET_ALARM_SERVER, default=True): bool,
+        vol.Required(CONF_ALARM_SERVER_HOST): str,
+        vol.Optional(RTSP_PORT_FORCED): vol.And(int, vol.Range(min=1)),
+    }
+)
+
+
+def normalize_host(host: str) -> str:
+    """Validate device address and strip trailing slashes, query and fragment."""
+    try:
+        url = urlsplit(host.strip())
+        # port is parsed lazily, reading it raises ValueError if malformed or out of range
+        url.port
+    except ValueError as ex:
+        raise vol.Invalid("invalid host") from ex
+    if url.scheme not in ("http", "https") or not url.hostname:
+        raise vol.Invalid("invalid host")
+    return urlunsplit((url.scheme, url.netloc, url.path.rstrip("/"), "", ""))
+
 
 class HikvisionConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for hikvision device."""
 
     VERSION = 3
     _entry: HikvisionConfigEntry
+    _local_ip: str | None = None
 
     async def get_schema(self, user_input: dict[str, Any]):
         """Get schema with suggested values."""
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_HOST, default="http://"): str,
-                vol.Optional(CONF_VERIFY_SSL, default=True): bool,
-                vol.Required(CONF_USERNAME): str,
-                vol.Required(CONF_PASSWORD): str,
-                vol.Required(CONF_SET_ALARM_SERVER, default=True): bool,
-                vol.Required(CONF_ALARM_SERVER_HOST): str,
-                vol.Optional(RTSP_PORT_FORCED): vol.And(int, vol.Range(min=1)),
-            }
-        )
         if self.source in (SOURCE_RECONFIGURE, SOURCE_REAUTH):
             return self.add_suggested_values_to_schema(
-                schema,
+                STEP_USER_DATA_SCHEMA,
                 {**self._entry.data, **(user_input or {})},
             )
-        local_ip = await async_get_source_ip(self.hass)
+        if user_input and CONF_ALARM_SERVER_HOST in user_input:
+            # form is shown again with errors, no need to resolve default alarm server
+            return self.add_suggested_values_to_schema(STEP_USER_DATA_SCHEMA, user_input)
+        if self._local_ip is None:
+            self._local_ip = await async_get_source_ip(self.hass)
         return self.add_suggested_values_to_schema(
-            schema,
-            {CONF_ALARM_SERVER_HOST: f"http://{local_ip}:8123", **(user_input or {})},
+            STEP_USER_DATA_SCHEMA,
+            {CONF_ALARM_SERVER_HOST: f"http://{self._local_ip}:8123", **(user_input or {})},
         )
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
@@ -67,22 +87,19 @@ class HikvisionConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                host = user_input[CONF_HOST].rstrip("/")
-                user_input_validated = {
-                    **user_input,
-                    CONF_HOST: host,
-                }
-
-                device = HikvisionDevice(self.hass, data=user_input_validated)
+                user_input[CONF_HOST] = normalize_host(user_input[CONF_HOST])
+                device = HikvisionDevice(self.hass, data=user_input)
                 await device.get_device_info()
 
+            except vol.Invalid:
+                errors["base"] = "invalid_host"
             except ISAPIForbiddenError:
                 errors["base"] = "insufficient_permission"
             except ISAPIUnauthorizedError:
                 errors["base"] = "invalid_auth"
-            except Exception as ex:  # pylint: disable=broad-except
-                _LOGGER.error("Unexpected %s %s", {type(ex).__name__}, ex)
-                errors["base"] = f"Unexpected {type(ex).__name__}: {ex}"
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected exception")
+                errors["base"] = "unknown"
 
             if not errors:
                 if self.source == SOURCE_RECONFIGURE:
@@ -90,16 +107,16 @@ class HikvisionConfigFlow(ConfigFlow, domain=DOMAIN):
                     self._abort_if_unique_id_mismatch()
                     return self.async_update_reload_and_abort(
                         self._entry,
-                        data_updates=user_input_validated,
+                        data_updates=user_input,
                     )
                 if self.source == SOURCE_REAUTH:
                     self._abort_if_unique_id_mismatch()
-                    return self.async_update_reload_and_abort(entry=self._entry, data=user_input_validated)
+                    return self.async_update_reload_and_abort(entry=self._entry, data=user_input)
 
                 # add new device
                 await self.async_set_unique_id(device.device_info.serial_no)
                 self._abort_if_unique_id_configured()
-                return self.async_create_entry(title=device.device_info.name, data=user_input_validated)
+                return self.async_create_entry(title=device.device_info.name, data=user_input)
 
         # show form
         schema = await self.get_schema(user_input)
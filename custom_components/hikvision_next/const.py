@@ -1,5 +1,8 @@
 """hikvision integration constants."""
 
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Final
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -24,45 +27,32 @@ ACTION_UPDATE_SNAPSHOT = "update_snapshot"
 
 HIKVISION_EVENT = f"{DOMAIN}_event"
 
-EVENTS = {
-    "motiondetection": {
-        **ISAPI_EVENTS["motiondetection"],
-        "device_class": BinarySensorDeviceClass.MOTION,
-    },
-    "tamperdetection": {
-        **ISAPI_EVENTS["tamperdetection"],
-        "device_class": BinarySensorDeviceClass.TAMPER,
-    },
-    "videoloss": {
-        **ISAPI_EVENTS["videoloss"],
-        "device_class": BinarySensorDeviceClass.PROBLEM,
-    },
-    "scenechangedetection": {
-        **ISAPI_EVENTS["scenechangedetection"],
-        "device_class": BinarySensorDeviceClass.TAMPER,
-    },
-    "fielddetection": {
-        **ISAPI_EVENTS["fielddetection"],
-        "device_class": BinarySensorDeviceClass.MOTION,
-    },
-    "linedetection": {
-        **ISAPI_EVENTS["linedetection"],
-        "device_class": BinarySensorDeviceClass.MOTION,
-    },
-    "regionentrance": {
-        **ISAPI_EVENTS["regionentrance"],
-        "device_class": BinarySensorDeviceClass.MOTION,
-    },
-    "regionexiting": {
-        **ISAPI_EVENTS["regionexiting"],
-        "device_class": BinarySensorDeviceClass.MOTION,
-    },
-    "io": {
-        **ISAPI_EVENTS["io"],
-        "device_class": BinarySensorDeviceClass.MOTION,
-    },
-    "pir": {
-        **ISAPI_EVENTS["pir"],
-        "device_class": BinarySensorDeviceClass.MOTION,
-    },
-}
+# views cannot be unregistered, the flag outlives config entries
+DATA_VIEW_REGISTERED: Final = f"{DOMAIN}_view_registered"
+
+
+@dataclass(slots=True, frozen=True)
+class EventSpec:
+    """Event type properties resolved at import time."""
+
+    type: str
+    device_class: BinarySensorDeviceClass
+
+
+EVENTS: Final[Mapping[str, EventSpec]] = MappingProxyType(
+    {
+        event_id: EventSpec(ISAPI_EVENTS[event_id].type, device_class)
+        for event_id, device_class in (
+            ("motiondetection", BinarySensorDeviceClass.MOTION),
+            ("tamperdetection", BinarySensorDeviceClass.TAMPER),
+            ("videoloss", BinarySensorDeviceClass.PROBLEM),
+            ("scenechangedetection", BinarySensorDeviceClass.TAMPER),
+            ("fielddetection", BinarySensorDeviceClass.MOTION),
+            ("linedetection", BinarySensorDeviceClass.MOTION),
+            ("regionentrance", BinarySensorDeviceClass.MOTION),
+            ("regionexiting", BinarySensorDeviceClass.MOTION),
+            ("io", BinarySensorDeviceClass.MOTION),
+            ("pir", BinarySensorDeviceClass.MOTION),
+        )
+    }
+)
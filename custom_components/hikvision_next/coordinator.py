@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
+from functools import partial
 import logging
+from typing import Any
 
-from homeassistant.components.switch import ENTITY_ID_FORMAT
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.util import slugify
+from homeassistant.util.async_ import create_eager_task
 
 from .const import CONF_ALARM_SERVER_HOST, DOMAIN, HOLIDAY_MODE
+from .isapi import ISAPIUnauthorizedError
 
 SCAN_INTERVAL_EVENTS = timedelta(seconds=120)
 SCAN_INTERVAL_HOLIDAYS = timedelta(minutes=60)
@@ -18,12 +22,62 @@ SCAN_INTERVAL_HOLIDAYS = timedelta(minutes=60)
 _LOGGER = logging.getLogger(__name__)
 
 
+async def async_gather_requests(device, requests: list[tuple[Callable[[], Awaitable[Any]], str]]) -> list[Any]:
+    """Run ISAPI requests concurrently, failed requests are handled and returned as exceptions.
+
+    requests are (request factory, error details) pairs.
+    """
+    # requests start eagerly, each runs up to its first network wait without a trip through the loop
+    results = await asyncio.gather(*(create_eager_task(request()) for request, _ in requests), return_exceptions=True)
+
+    if unauthorized := [i for i, result in enumerate(results) if isinstance(result, ISAPIUnauthorizedError)]:
+        # after device reboot, authorization token may have expired, retry once with renewed authorization
+        device.handle_exception(results[unauthorized[0]], requests[unauthorized[0]][1])
+        # detect authorization once, retried requests share it and start eagerly like the first pass
+        try:
+            await device.ensure_auth_method()
+        except Exception as ex:  # noqa: BLE001
+            retried = [ex] * len(unauthorized)
+        else:
+            retried = await asyncio.gather(
+                *(create_eager_task(requests[i][0]()) for i in unauthorized), return_exceptions=True
+            )
+        for i, result in zip(unauthorized, retried):
+            results[i] = result
+
+    # persisting unauthorized error is reported once
+    unauthorized_handled = False
+    for (_, details), result in zip(requests, results):
+        if isinstance(result, Exception):
+            if isinstance(result, ISAPIUnauthorizedError):
+                if unauthorized_handled:
+                    continue
+                unauthorized_handled = True
+            device.handle_exception(result, details)
+
+    if device.auth_token_expired:
+        device.auth_token_expired = False
+
+    return results
+
+
 class EventsCoordinator(DataUpdateCoordinator):
     """Manage fetching events state from NVR or camera."""
 
     def __init__(self, hass: HomeAssistant, device) -> None:
         """Initialize."""
         self.device = device
+        # switch entity ids are fixed for the lifetime of the coordinator,
+        # events disabled on the device are known at setup and have no state to poll
+        self._events = [
+            (f"switch.{event.unique_id}", event)
+            for event in (*(e for camera in device.cameras for e in camera.events_info), *device.events_info)
+            if not event.disabled
+        ]
+        self._output_ports = [
+            (f"switch.{device.serial_no_slug}_{i}_alarm_output", i)
+            for i in range(1, device.capabilities.output_ports + 1)
+        ]
 
         super().__init__(
             hass,
@@ -35,45 +89,31 @@ class EventsCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self):
         """Update data via ISAPI."""
         data = {}
+        requests = []
 
-        # Get camera event status
-        for camera in self.device.cameras:
-            for event in camera.events_info:
-                if event.disabled:
-                    continue
-                try:
-                    _id = ENTITY_ID_FORMAT.format(event.unique_id)
-                    data[_id] = await self.device.get_event_enabled_state(event)
-                except Exception as ex:  # pylint: disable=broad-except
-                    self.device.handle_exception(ex, f"Cannot fetch state for {event.id}")
-
-        # Get NVR event status
-        for event in self.device.events_info:
-            if event.disabled:
-                continue
-            try:
-                _id = ENTITY_ID_FORMAT.format(event.unique_id)
-                data[_id] = await self.device.get_event_enabled_state(event)
-            except Exception as ex:  # pylint: disable=broad-except
-                self.device.handle_exception(ex, f"Cannot fetch state for {event.id}")
+        # Get camera and NVR event status
+        for _id, event in self._events:
+            requests.append(
+                (_id, partial(self.device.get_event_enabled_state, event), f"Cannot fetch state for {event.id}")
+            )
 
         # Get output port(s) status
-        for i in range(1, self.device.capabilities.output_ports + 1):
-            try:
-                _id = ENTITY_ID_FORMAT.format(f"{slugify(self.device.device_info.serial_no.lower())}_{i}_alarm_output")
-                data[_id] = await self.device.get_io_port_status("output", i)
-            except Exception as ex:  # pylint: disable=broad-except
-                self.device.handle_exception(ex, f"Cannot fetch state for alarm output {i}")
+        for _id, i in self._output_ports:
+            requests.append(
+                (_id, partial(self.device.get_io_port_status, "output", i), f"Cannot fetch state for alarm output {i}")
+            )
 
         # Refresh HDD data
-        try:
-            self.device.storage = await self.device.get_storage_devices()
-        except Exception as ex:  # pylint: disable=broad-except
-            self.device.handle_exception(ex, "Cannot fetch storage state")
+        requests.append((None, self.device.get_storage_devices, "Cannot fetch storage state"))
 
-
-        if self.device.auth_token_expired:
-            self.device.auth_token_expired = False
+        results = await async_gather_requests(self.device, [(request, details) for _, request, details in requests])
+        for (_id, _, _), result in zip(requests, results):
+            if isinstance(result, Exception):
+                continue
+            if _id:
+                data[_id] = result
+            else:
+                self.device.storage = result
 
         return data
 
@@ -91,25 +131,35 @@ class SecondaryCoordinator(DataUpdateCoordinator):
             name=DOMAIN,
             update_interval=SCAN_INTERVAL_HOLIDAYS,
         )
+        # first refresh runs in background, entities may be added before data is fetched
+        self.data = {}
+        # device capabilities do not change without reloading the entry
+        self._support_holiday_mode = device.capabilities.support_holiday_mode
+        self._support_alarm_server = device.capabilities.support_alarm_server
 
     async def _async_update_data(self):
         """Update data via ISAPI."""
         data = {}
-        try:
-            if self.device.capabilities.support_holiday_mode:
-                data[HOLIDAY_MODE] = await self.device.get_holiday_enabled_state()
-        except Exception as ex:  # pylint: disable=broad-except
-            self.device.handle_exception(ex, f"Cannot fetch state for {HOLIDAY_MODE}")
-        try:
-            if self.device.capabilities.support_alarm_server:
-                alarm_server = await self.device.get_alarm_server()
-                data[CONF_ALARM_SERVER_HOST] = {
-                    "protocol_type": alarm_server.protocol_type,
-                    "address": alarm_server.ip_address or alarm_server.host_name,
-                    "port_no": alarm_server.port_no,
-                    "path": alarm_server.url,
-
-                }
-        except Exception as ex:  # pylint: disable=broad-except
-            self.device.handle_exception(ex, f"Cannot fetch state for {CONF_ALARM_SERVER_HOST}")
+        requests = []
+        if self._support_holiday_mode:
+            requests.append((HOLIDAY_MODE, self.device.get_holiday_enabled_state))
+        if self._support_alarm_server:
+            requests.append((CONF_ALARM_SERVER_HOST, self._get_alarm_server))
+
+        results = await async_gather_requests(
+            self.device, [(request, f"Cannot fetch state for {key}") for key, request in requests]
+        )
+        for (key, _), result in zip(requests, results):
+            if not isinstance(result, Exception):
+                data[key] = result
         return data
+
+    async def _get_alarm_server(self) -> dict:
+        """Get notifications host settings."""
+        alarm_server = await self.device.get_alarm_server()
+        return {
+            "protocol_type": alarm_server.protocol_type,
+            "address": alarm_server.ip_address or alarm_server.host_name,
+            "port_no": alarm_server.port_no,
+            "path": alarm_server.url,
+        }
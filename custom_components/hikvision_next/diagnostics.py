@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import inspect
-import json
+import asyncio
 import random
 from typing import Any
 
@@ -20,8 +19,7 @@ from .isapi.const import GET, STREAM_TYPE
 def anonymise_mac(orignal: str):
     """Anonymise MAC address."""
 
-    mac = [random.randint(0x00, 0xFF) for _ in range(6)]
-    return ":".join("%02x" % x for x in mac)
+    return random.randbytes(6).hex(":")
 
 
 def anonymise_ip(orignal: str):
@@ -52,8 +50,6 @@ ANON_KEYS = {
     "deviceID": anonymise_serial,
 }
 
-anon_map = {}
-
 
 async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: HikvisionConfigEntry) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
@@ -71,11 +67,7 @@ async def _async_get_diagnostics(
     # Get info set
     info = {}
 
-    # Add camera info
-    # info.update({"Cameras": [to_json(camera) for camera in isapi.cameras]})
-
     # ISAPI responses
-    responses = {}
     endpoints = [
         "System/deviceInfo",
         "System/capabilities",
@@ -93,30 +85,33 @@ async def _async_get_diagnostics(
         "Streaming/channels",
     ]
 
-    for endpoint in endpoints:
-        responses[endpoint] = await get_isapi_data(device, endpoint)
-
     # channels
     for camera in device.cameras:
         for stream_type_id in STREAM_TYPE:
-            endpoint = f"Streaming/channels/{camera.id}0{stream_type_id}"
-            responses[endpoint] = await get_isapi_data(device, endpoint)
+            endpoints.append(f"Streaming/channels/{camera.id}0{stream_type_id}")
 
     # event states
     for camera in device.cameras:
         for event in camera.events_info:
-            responses[event.url] = await get_isapi_data(device, event.url)
+            endpoints.append(event.url)
+
+    # event urls may repeat the endpoints above, fetch each url once
+    endpoints = list(dict.fromkeys(endpoints))
+    # same values are anonymised the same way across the whole dump, but not across dumps
+    anon_map = {}
+    results = await asyncio.gather(*(get_isapi_data(device, endpoint, anon_map) for endpoint in endpoints))
+    responses = dict(zip(endpoints, results))
 
     info["ISAPI"] = responses
     return info
 
 
-async def get_isapi_data(isapi, endpoint: str) -> dict:
+async def get_isapi_data(isapi, endpoint: str, anon_map: dict | None = None) -> dict:
     """Get data from ISAPI."""
     entry = {}
     try:
         response = await isapi.request(GET, endpoint)
-        entry["response"] = anonymise_data(response)
+        entry["response"] = anonymise_data(response, anon_map)
     except (HTTPStatusError, ISAPIUnauthorizedError, ISAPIForbiddenError) as ex:
         entry["status_code"] = ex.response.status_code
     except Exception as ex:  # noqa: BLE001
@@ -124,56 +119,27 @@ async def get_isapi_data(isapi, endpoint: str) -> dict:
     return entry
 
 
-def to_json(obj):
-    """Convert object to json."""
-    result = json.dumps(obj, cls=ObjectEncoder, sort_keys=True, indent=2)
-    result = json.loads(result)
-    return anonymise_data(result)
-
-
-def anonymise_data(data):
-    """Anonymise sensitive data."""
-    if isinstance(data, dict):
-        result = {}
-        for key, value in data.items():
-            if key in ANON_KEYS and value is not None:
-                if value in anon_map:
-                    result[key] = anon_map[value]
-                else:
-                    anon_fn = ANON_KEYS[key]
-                    anon_map[value] = result[key] = anon_fn(value)
-            else:
-                result[key] = anonymise_data(value)
-        return result
-    if isinstance(data, list):
-        result = []
-        for item in data:
-            result.append(anonymise_data(item))
-        return result
+def anonymise_data(data, anon_map: dict | None = None):
+    """Anonymise sensitive data in place."""
+    if anon_map is None:
+        anon_map = {}
+
+    # most responses have no sensitive keys, a substring scan of the repr is much cheaper than the walk
+    text = repr(data)
+    if not any(key in text for key in ANON_KEYS):
+        return data
+
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if (anon_fn := ANON_KEYS.get(key)) and value is not None:
+                    if value not in anon_map:
+                        anon_map[value] = anon_fn(value)
+                    node[key] = anon_map[value]
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
     return data
-
-
-class ObjectEncoder(json.JSONEncoder):
-    """Class to encode object to json."""
-
-    def default(self, o):
-        """Implement encoding logic."""
-        if hasattr(o, "to_json"):
-            return self.default(o.to_json())
-
-        if hasattr(o, "__dict__"):
-            data = {
-                key: value
-                for key, value in inspect.getmembers(o)
-                if not key.startswith("__")
-                and not inspect.isabstract(value)
-                and not inspect.isbuiltin(value)
-                and not inspect.isfunction(value)
-                and not inspect.isgenerator(value)
-                and not inspect.isgeneratorfunction(value)
-                and not inspect.ismethod(value)
-                and not inspect.ismethoddescriptor(value)
-                and not inspect.isroutine(value)
-            }
-            return self.default(data)
-        return o
@@ -1,7 +1,11 @@
 "ISAPI client for Home Assistant integration."
 
+from __future__ import annotations
+
+import asyncio
+from functools import cached_property
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
@@ -33,6 +37,9 @@ from .isapi import (
 )
 from .isapi.const import EVENT_IO
 
+if TYPE_CHECKING:
+    from .binary_sensor import EventBinarySensor
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -64,11 +71,18 @@ class HikvisionDevice(ISAPIClient):
         super().__init__(host, username, password, verify_ssl, rtsp_port_forced, session)
 
         self.events_info: list[EventInfo] = []
+        # event binary sensors added to hass by unique_id, for dispatching incoming alerts
+        self.event_sensors: dict[str, EventBinarySensor] = {}
+        # device info is shared by all entities of a camera, built once per camera id
+        self._device_info_cache: dict[int, DeviceInfo] = {}
+        # supported events handled by integration grouped by camera id (NVR = None), built on first use
+        self._events_by_camera: dict[int | None, list[EventInfo]] | None = None
 
     async def init_coordinators(self):
         """Initialize coordinators."""
 
         # init events supported by integration
+        self._events_by_camera = None
         self.events_info = self.get_device_event_capabilities()
         for camera in self.cameras:
             camera.events_info = self.get_device_event_capabilities(camera.id)
@@ -79,21 +93,39 @@ class HikvisionDevice(ISAPIClient):
         if (
             self.capabilities.support_holiday_mode
             or self.capabilities.support_alarm_server
-            or self.capabilities.storage
+            or self.storage
         ):
             self.coordinators[SECONDARY_COORDINATOR] = SecondaryCoordinator(self.hass, self)
 
+        # first data fetch, events state does not depend on alarm server so both requests can overlap
+        setup_tasks = [self.coordinators[EVENTS_COORDINATOR].async_config_entry_first_refresh()]
         if self.control_alarm_server_host and self.capabilities.support_alarm_server:
-            await self.set_alarm_server(self.alarm_server_host, ALARM_SERVER_PATH)
+            setup_tasks.append(self.set_alarm_server(self.alarm_server_host, ALARM_SERVER_PATH))
+        # wait for both to finish so none is left running on failure, TaskGroup would wrap ConfigEntryNotReady
+        for result in await asyncio.gather(*setup_tasks, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
+
+        # holidays and alarm server are not needed to set up entities, fetch them in background
+        if secondary_coordinator := self.coordinators.get(SECONDARY_COORDINATOR):
+            self.entry.async_create_task(
+                self.hass,
+                secondary_coordinator.async_refresh(),
+                f"{DOMAIN} {self.host} secondary first refresh",
+            )
 
-        # first data fetch
-        for coordinator in self.coordinators.values():
-            await coordinator.async_config_entry_first_refresh()
+    @cached_property
+    def serial_no_slug(self) -> str:
+        """Return slugified serial number, the prefix of entity unique ids."""
+        return slugify(self.device_info.serial_no.lower())
 
     def hass_device_info(self, camera_id: int = 0) -> DeviceInfo:
         """Return Home Assistant entity device information."""
+        if device_info := self._device_info_cache.get(camera_id):
+            return device_info
+
         if camera_id == 0:
-            return DeviceInfo(
+            device_info = DeviceInfo(
                 manufacturer=self.device_info.manufacturer,
                 identifiers={(DOMAIN, self.device_info.serial_no)},
                 connections={(dr.CONNECTION_NETWORK_MAC, self.device_info.mac_address)},
@@ -105,7 +137,7 @@ class HikvisionDevice(ISAPIClient):
             camera_info = self.get_camera_by_id(camera_id)
             is_ip_camera = isinstance(camera_info, IPCamera)
 
-            return DeviceInfo(
+            device_info = DeviceInfo(
                 manufacturer=self.device_info.manufacturer,
                 identifiers={(DOMAIN, camera_info.serial_no)},
                 model=camera_info.model,
@@ -113,35 +145,42 @@ class HikvisionDevice(ISAPIClient):
                 sw_version=camera_info.firmware if is_ip_camera else "Unknown",
                 via_device=(DOMAIN, self.device_info.serial_no) if self.device_info.is_nvr else None,
             )
+        self._device_info_cache[camera_id] = device_info
+        return device_info
 
     def get_device_event_capabilities(
         self,
         camera_id: int | None = None,
     ) -> list[EventInfo]:
         """Get events info handled by integration (camera id:  NVR = None, camera > 0)."""
-        events = []
+        if self._events_by_camera is None:
+            self._events_by_camera = self._group_supported_events()
+        integration_supported_events = self._events_by_camera.get(None if camera_id is None else int(camera_id), [])
 
-        if camera_id is None:  # NVR
-            integration_supported_events = [
-                s for s in self.supported_events if (s.id in EVENTS and EVENTS[s.id].get("type") == EVENT_IO)
-            ]
-        else:  # Camera
-            integration_supported_events = [
-                s for s in self.supported_events if (s.channel_id == int(camera_id) and s.id in EVENTS)
-            ]
+        # unique_id prefix is common to all events of the camera
+        prefix = f"{self.serial_no_slug}_{camera_id}" if camera_id else self.serial_no_slug
 
+        events = []
         for event in integration_supported_events:
-            # Build unique_id
-            device_id_param = f"_{camera_id}" if camera_id else ""
-            io_port_id_param = f"_{event.io_port_id}" if event.io_port_id != 0 else ""
-            unique_id = f"{slugify(self.device_info.serial_no.lower())}{device_id_param}{io_port_id_param}_{event.id}"
-
-            if EVENTS.get(event.id):
-                event.unique_id = unique_id
-                event.disabled = "center" not in event.notifications  # Disable if not set Notify Surveillance Center
-                events.append(event)
+            if event.io_port_id != 0:
+                event.unique_id = f"{prefix}_{event.io_port_id}_{event.id}"
+            else:
+                event.unique_id = f"{prefix}_{event.id}"
+            event.disabled = "center" not in event.notifications  # Disable if not set Notify Surveillance Center
+            events.append(event)
         return events
 
+    def _group_supported_events(self) -> dict[int | None, list[EventInfo]]:
+        """Group supported events handled by integration by camera id, NVR io events under None."""
+        grouped: dict[int | None, list[EventInfo]] = {None: []}
+        for event in self.supported_events:
+            if not (event_spec := EVENTS.get(event.id)):
+                continue
+            if event_spec.type == EVENT_IO:
+                grouped[None].append(event)
+            grouped.setdefault(event.channel_id, []).append(event)
+        return grouped
+
     def handle_exception(self, ex: Exception, details: str = ""):
         """Handle common exceptions."""
 
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 import logging
+import os
 
 import voluptuous as vol
 
@@ -12,7 +13,6 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.template import Template
-from homeassistant.util import slugify
 
 from . import HikvisionConfigEntry
 from .const import ACTION_UPDATE_SNAPSHOT
@@ -29,13 +29,12 @@ async def async_setup_entry(
 
     device = entry.runtime_data
 
-    entities = []
-    for camera in device.cameras:
-        for stream in camera.streams:
-            if stream.type_id == 1:
-                entities.append(SnapshotFile(hass, device, camera, stream))
-
-    async_add_entities(entities)
+    async_add_entities(
+        SnapshotFile(hass, device, camera, stream)
+        for camera in device.cameras
+        for stream in camera.streams
+        if stream.type_id == 1
+    )
 
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
@@ -50,6 +49,9 @@ class SnapshotFile(ImageEntity):
 
     _attr_has_entity_name = True
     file_path = None
+    # last read file content and the (path, mtime, size) it was read at
+    _file_content: bytes | None = None
+    _file_key: tuple[str, int, int] | None = None
 
     def __init__(
         self,
@@ -62,7 +64,7 @@ class SnapshotFile(ImageEntity):
 
         ImageEntity.__init__(self, hass)
 
-        self._attr_unique_id = slugify(f"{device.device_info.serial_no.lower()}_{stream_info.id}_snapshot")
+        self._attr_unique_id = f"{device.serial_no_slug}_{stream_info.id}_snapshot"
         self.entity_id = f"camera.{self.unique_id}"
         self._attr_translation_key = "snapshot"
         self._attr_translation_placeholders = {"camera": camera.name}
@@ -71,8 +73,14 @@ class SnapshotFile(ImageEntity):
         """Return bytes of image."""
         try:
             if self.file_path:
-                with open(self.file_path, "rb") as file:
-                    return file.read()
+                # the file is read again only when it has changed
+                stat = os.stat(self.file_path)
+                file_key = (self.file_path, stat.st_mtime_ns, stat.st_size)
+                if file_key != self._file_key:
+                    with open(self.file_path, "rb") as file:
+                        self._file_content = file.read()
+                    self._file_key = file_key
+                return self._file_content
         except FileNotFoundError:
             _LOGGER.warning(
                 "Could not read camera %s image from file: %s",
@@ -87,5 +95,7 @@ class SnapshotFile(ImageEntity):
     ) -> None:
         """Update the file_path."""
         self.file_path = filename.async_render(variables={ATTR_ENTITY_ID: self.entity_id})
+        # the file may be overwritten within the mtime resolution, read it again
+        self._file_key = None
         self._attr_image_last_updated = datetime.now()
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
@@ -1,3 +1,6 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Final
 
 GET = "GET"
@@ -7,70 +10,80 @@ POST = "POST"
 CONNECTION_TYPE_DIRECT = "Direct"
 CONNECTION_TYPE_PROXIED = "Proxied"
 
+MAX_CONCURRENT_REQUESTS: Final = 6
+
 EVENT_BASIC: Final = "basic"
 EVENT_IO: Final = "io"
 EVENT_SMART: Final = "smart"
 EVENT_PIR: Final = "pir"
-EVENTS = {
-    "motiondetection": {
-        "type": EVENT_BASIC,
-        "label": "Motion",
-        "slug": "motionDetection",
-        "mutex": True,
-    },
-    "tamperdetection": {
-        "type": EVENT_BASIC,
-        "label": "Video Tampering",
-        "slug": "tamperDetection",
-    },
-    "videoloss": {
-        "type": EVENT_BASIC,
-        "label": "Video Loss",
-        "slug": "videoLoss",
-    },
-    "scenechangedetection": {
-        "type": EVENT_SMART,
-        "label": "Scene Change",
-        "slug": "SceneChangeDetection",
-        "mutex": True,
-    },
-    "fielddetection": {
-        "type": EVENT_SMART,
-        "label": "Intrusion",
-        "slug": "FieldDetection",
-        "mutex": True,
-    },
-    "linedetection": {
-        "type": EVENT_SMART,
-        "label": "Line Crossing",
-        "slug": "LineDetection",
-        "mutex": True,
-    },
-    "regionentrance": {
-        "type": EVENT_SMART,
-        "label": "Region Entrance",
-        "slug": "regionEntrance",
-    },
-    "regionexiting": {
-        "type": EVENT_SMART,
-        "label": "Region Exiting",
-        "slug": "regionExiting",
-    },
-    "io": {
-        "type": EVENT_IO,
-        "label": "Alarm Input",
-        "slug": "inputs",
-        "direct_node": "IOInputPort",
-        "proxied_node": "IOProxyInputPort",
-    },
-    "pir": {
-        "type": EVENT_PIR,
-        "label": "PIR",
-        "slug": "WLAlarm/PIR",
-        "direct_node": "PIRAlarm",
-    },
+
+
+@dataclass(slots=True, frozen=True)
+class EventMeta:
+    """ISAPI event type properties."""
+
+    type: str
+    label: str
+    slug: str
+    mutex: bool = False
+    # alternate xml node names of the event state
+    direct_node: str | None = None
+    proxied_node: str | None = None
+
+
+# event type definitions are shared read-only
+EVENTS: Final[Mapping[str, EventMeta]] = MappingProxyType(
+    {
+        "motiondetection": EventMeta(type=EVENT_BASIC, label="Motion", slug="motionDetection", mutex=True),
+        "tamperdetection": EventMeta(type=EVENT_BASIC, label="Video Tampering", slug="tamperDetection"),
+        "videoloss": EventMeta(type=EVENT_BASIC, label="Video Loss", slug="videoLoss"),
+        "scenechangedetection": EventMeta(
+            type=EVENT_SMART, label="Scene Change", slug="SceneChangeDetection", mutex=True
+        ),
+        "fielddetection": EventMeta(type=EVENT_SMART, label="Intrusion", slug="FieldDetection", mutex=True),
+        "linedetection": EventMeta(type=EVENT_SMART, label="Line Crossing", slug="LineDetection", mutex=True),
+        "regionentrance": EventMeta(type=EVENT_SMART, label="Region Entrance", slug="regionEntrance"),
+        "regionexiting": EventMeta(type=EVENT_SMART, label="Region Exiting", slug="regionExiting"),
+        "io": EventMeta(
+            type=EVENT_IO,
+            label="Alarm Input",
+            slug="inputs",
+            direct_node="IOInputPort",
+            proxied_node="IOProxyInputPort",
+        ),
+        "pir": EventMeta(type=EVENT_PIR, label="PIR", slug="WLAlarm/PIR", direct_node="PIRAlarm"),
+    }
+)
+
+# ISAPI url formats of event types, (direct, proxied)
+EVENT_URL_FORMATS: Final = {
+    EVENT_BASIC: (
+        "System/Video/inputs/channels/{channel_id}/{slug}",
+        "ContentMgmt/InputProxy/channels/{channel_id}/video/{slug}",
+    ),
+    EVENT_IO: ("System/IO/{slug}/{io_port_id}", "ContentMgmt/IOProxy/{slug}/{io_port_id}"),
+    EVENT_SMART: ("Smart/{slug}/{channel_id}", "Smart/{slug}/{channel_id}"),
+    EVENT_PIR: ("{slug}", "{slug}"),
 }
 
+# event url formats with the slug already filled in, (direct, proxied)
+EVENT_URLS: Final[Mapping[str, tuple[str, str]]] = MappingProxyType(
+    {
+        event_id: tuple(url.replace("{slug}", event.slug) for url in EVENT_URL_FORMATS[event.type])
+        for event_id, event in EVENTS.items()
+    }
+)
+
+# xml node names of event states, some event types use alternate node names, (direct, proxied)
+EVENT_STATE_NODES: Final[Mapping[str, tuple[str, str]]] = MappingProxyType(
+    {
+        event_id: tuple(
+            node[0].upper() + node[1:] for node in (event.direct_node or event.slug, event.proxied_node or event.slug)
+        )
+        for event_id, event in EVENTS.items()
+    }
+)
+
 STREAM_TYPE = {
     1: "Main Stream",
     2: "Sub-stream",
@@ -87,3 +100,6 @@ EVENTS_ALTERNATE_ID = {
 }
 
 MUTEX_ALTERNATE_ID = {"motiondetection": "VMDHumanVehicle"}
+
+# events that may be mutually exclusive with other enabled events
+MUTEX_EVENTS: Final = frozenset(event_id for event_id, event in EVENTS.items() if event.mutex)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import suppress
 import datetime
 from http import HTTPStatus
@@ -10,6 +11,7 @@ import json
 import logging
 from typing import Any, AsyncIterator
 from urllib.parse import quote, urljoin, urlparse
+from xml.etree import ElementTree
 
 import httpx
 from httpx import HTTPStatusError
@@ -18,13 +20,16 @@ import xmltodict
 from .const import (
     CONNECTION_TYPE_DIRECT,
     CONNECTION_TYPE_PROXIED,
-    EVENT_BASIC,
     EVENT_IO,
     EVENT_PIR,
+    EVENT_STATE_NODES,
+    EVENT_URLS,
     EVENTS,
     EVENTS_ALTERNATE_ID,
     GET,
+    MAX_CONCURRENT_REQUESTS,
     MUTEX_ALTERNATE_ID,
+    MUTEX_EVENTS,
     POST,
     PUT,
     STREAM_TYPE,
@@ -42,7 +47,7 @@ from .models import (
     ProtocolsInfo,
     StorageInfo,
 )
-from .utils import bool_to_str, deep_get, parse_isapi_response, str_to_bool
+from .utils import bool_to_str, deep_get, find_text, parse_isapi_response, str_to_bool
 
 Node = dict[str, Any]
 
@@ -67,16 +72,24 @@ class ISAPIClient:
         self.username = username
         self.password = password
         self.verify_ssl = verify_ssl
-        self.timeout = 20
+        # fail fast on unreachable devices, large documents and snapshots may take longer to be sent
+        self.timeout = httpx.Timeout(connect=3.0, read=10.0, write=5.0, pool=3.0)
+        self.slow_timeout = httpx.Timeout(connect=3.0, read=30.0, write=5.0, pool=3.0)
         self.isapi_prefix = "ISAPI"
         self._session = session
         self._auth_method: httpx._auth.Auth = None
+        # embedded web servers handle few connections, limit concurrent requests to the device
+        self._request_limit = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # concurrent requests share a single authentication method detection
+        self._auth_lock = asyncio.Lock()
 
         self.rtsp_port_forced = rtsp_port_forced
 
         self.device_info = ISAPIDeviceInfo()
         self.capabilities = CapabilitiesInfo()
         self.cameras: list[IPCamera | AnalogCamera] = []
+        # cameras indexed by id, rebuilt by get_cameras
+        self._cameras_by_id: dict[int, IPCamera | AnalogCamera] = {}
         self.supported_events: list[EventInfo] = []
         self.storage: list[StorageInfo] = []
         self.protocols = ProtocolsInfo()
@@ -99,7 +112,8 @@ class ISAPIClient:
     async def get_hardware_info(self):
         """Get device all data."""
         await self.get_device_info()
-        capabilities = (await self.request(GET, "System/capabilities")).get("DeviceCap", {})
+        capabilities = await self.request(GET, "System/capabilities", timeout=self.slow_timeout)
+        capabilities = capabilities.get("DeviceCap", {})
 
         self.capabilities.analog_cameras_inputs = int(deep_get(capabilities, "SysCap.VideoCap.videoInputPortNums", 0))
         self.capabilities.digital_cameras_inputs = int(deep_get(capabilities, "RacmCap.inputProxyNums", 0))
@@ -112,19 +126,36 @@ class ISAPIClient:
         )
         self.capabilities.input_ports = int(deep_get(capabilities, "SysCap.IOCap.IOInputPortNums", 0))
         self.capabilities.output_ports = int(deep_get(capabilities, "SysCap.IOCap.IOOutputPortNums", 0))
-        self.capabilities.support_alarm_server = bool(await self.get_alarm_server())
 
         # Set if NVR based on whether more than 1 supported IP or analog cameras
         # Single IP camera will show 0 supported devices in total
         if self.capabilities.analog_cameras_inputs + self.capabilities.digital_cameras_inputs > 1:
             self.device_info.is_nvr = True
 
-        await self.get_cameras()
+        # remaining probes are independent of each other, fetch them concurrently
+        results = await asyncio.gather(
+            self.probe_alarm_server(),
+            self.probe_cameras(capabilities),
+            self.get_protocols(),
+            self.probe_storage(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
-        self.supported_events = await self.get_supported_events(capabilities)
+    async def probe_alarm_server(self):
+        """Check if device supports event notifications listener server."""
+        self.capabilities.support_alarm_server = bool(await self.get_alarm_server())
 
-        await self.get_protocols()
+    async def probe_cameras(self, system_capabilities: dict):
+        """Get cameras and events they support."""
+        await self.get_cameras()
+        # multichannel flag is set by get_cameras
+        self.supported_events = await self.get_supported_events(system_capabilities)
 
+    async def probe_storage(self):
+        """Get storage devices, ignore errors as not all devices have storage."""
         with suppress(Exception):
             self.storage = await self.get_storage_devices()
 
@@ -142,7 +173,17 @@ class ISAPIClient:
                 channel_ids.add(channel_id)
 
             self.capabilities.is_multi_channel = len(channel_ids) > 1
-            for channel_id in sorted(channel_ids):
+            channel_ids = sorted(channel_ids)
+            # streams of all channels are probed concurrently
+            # all probes finish before the first error is raised, none is left running
+            channels_streams = await asyncio.gather(
+                *(self.get_camera_streams(channel_id) for channel_id in channel_ids),
+                return_exceptions=True,
+            )
+            for result in channels_streams:
+                if isinstance(result, BaseException):
+                    raise result
+            for channel_id, streams in zip(channel_ids, channels_streams):
                 # Determine camera name
                 if len(channel_ids) > 1:
                     camera_name = f"{self.device_info.name} - Channel {channel_id}"
@@ -158,7 +199,7 @@ class ISAPIClient:
                     input_port=channel_id,
                     connection_type=CONNECTION_TYPE_DIRECT,
                     ip_addr=self.device_info.ip_address,
-                    streams=await self.get_camera_streams(channel_id),
+                    streams=streams,
                 )
                 self.cameras.append(camera)
         else:
@@ -170,11 +211,17 @@ class ISAPIClient:
                     [],
                 )
 
-                for digital_camera in digital_cameras:
+                digital_cameras = [camera for camera in digital_cameras if camera.get("sourceInputPortDescriptor")]
+                cameras_streams = await asyncio.gather(
+                    *(self.get_camera_streams(camera.get("id")) for camera in digital_cameras),
+                    return_exceptions=True,
+                )
+                for result in cameras_streams:
+                    if isinstance(result, BaseException):
+                        raise result
+                for digital_camera, streams in zip(digital_cameras, cameras_streams):
                     camera_id = digital_camera.get("id")
                     source = digital_camera.get("sourceInputPortDescriptor")
-                    if not source:
-                        continue
 
                     serial_no = source.get("serialNumber")
                     if not serial_no or self.get_camera_by_serial_no(serial_no):
@@ -192,7 +239,7 @@ class ISAPIClient:
                             connection_type=CONNECTION_TYPE_PROXIED,
                             ip_addr=source.get("ipAddress"),
                             ip_port=source.get("managePortNo"),
-                            streams=await self.get_camera_streams(camera_id),
+                            streams=streams,
                         )
                     )
 
@@ -204,7 +251,14 @@ class ISAPIClient:
                     [],
                 )
 
-                for analog_camera in analog_cameras:
+                cameras_streams = await asyncio.gather(
+                    *(self.get_camera_streams(camera.get("id")) for camera in analog_cameras),
+                    return_exceptions=True,
+                )
+                for result in cameras_streams:
+                    if isinstance(result, BaseException):
+                        raise result
+                for analog_camera, streams in zip(analog_cameras, cameras_streams):
                     camera_id = analog_camera.get("id")
                     device_serial_no = f"{self.device_info.serial_no}-VI{camera_id}"
 
@@ -216,10 +270,12 @@ class ISAPIClient:
                             serial_no=device_serial_no,
                             input_port=int(analog_camera.get("inputPort")),
                             connection_type=CONNECTION_TYPE_DIRECT,
-                            streams=await self.get_camera_streams(camera_id),
+                            streams=streams,
                         )
                     )
 
+        self._cameras_by_id = {camera.id: camera for camera in self.cameras}
+
     async def get_protocols(self):
         """Get protocols and ports."""
         protocols = deep_get(
@@ -247,8 +303,7 @@ class ISAPIClient:
                 return None
             event_id = event_type.lower()
             # Translate to alternate IDs
-            if event_id in EVENTS_ALTERNATE_ID:
-                event_id = EVENTS_ALTERNATE_ID[event_id]
+            event_id = EVENTS_ALTERNATE_ID.get(event_id, event_id)
 
             if event_id == EVENT_PIR:
                 is_supported = str_to_bool(deep_get(system_capabilities, "WLAlarmCap.isSupportPIR", False))
@@ -286,7 +341,7 @@ class ISAPIClient:
         events = []
 
         # Get events from Event/triggers
-        event_triggers = await self.request(GET, "Event/triggers")
+        event_triggers = await self.request(GET, "Event/triggers", timeout=self.slow_timeout)
         event_notification = event_triggers.get("EventNotification")
         if event_notification:
             available_events = deep_get(event_notification, "EventTriggerList.EventTrigger", [])
@@ -308,58 +363,42 @@ class ISAPIClient:
 
         # multichannel camera needs to fetch events for each channel
         if self.capabilities.is_multi_channel:
-            channels_capabilities = await self.request(GET, "Event/channels/capabilities")
+            channels_capabilities = await self.request(GET, "Event/channels/capabilities", timeout=self.slow_timeout)
             channel_events = deep_get(channels_capabilities, "ChannelEventCapList.ChannelEventCap", [])
+            known_events = {(e.id, e.channel_id) for e in events}
             for event_cap in channel_events:
                 event_types = deep_get(event_cap, "eventType").get("@opt", "").split(",")
                 channel_id = int(event_cap.get("channelID"))
                 for event_type in event_types:
                     event_id = event_type.lower()
-                    if event_id in EVENTS_ALTERNATE_ID:
-                        event_id = EVENTS_ALTERNATE_ID[event_id]
+                    event_id = EVENTS_ALTERNATE_ID.get(event_id, event_id)
                     if event_id not in EVENTS:
                         continue
-                    if not [e for e in events if (e.id == event_id and e.channel_id == channel_id)]:
+                    if (event_id, channel_id) not in known_events:
                         event_trigger = await self.request(GET, f"Event/triggers/{event_id}-{channel_id}")
                         event_trigger = deep_get(event_trigger, "EventTrigger", {})
                         if event := create_event_info(event_trigger):
                             events.append(event)
+                            known_events.add((event.id, event.channel_id))
 
         return events
 
     def get_event_url(self, event_id: str, channel_id: int, io_port_id: int, is_proxy: bool) -> str | None:
         """Get event ISAPI URL."""
 
-        if not EVENTS.get(event_id):
+        if not (urls := EVENT_URLS.get(event_id)):
             return None
-
-        event_type = EVENTS[event_id]["type"]
-        slug = EVENTS[event_id]["slug"]
-
-        if event_type == EVENT_BASIC:
-            if is_proxy:
-                url = f"ContentMgmt/InputProxy/channels/{channel_id}/video/{slug}"
-            else:
-                url = f"System/Video/inputs/channels/{channel_id}/{slug}"
-
-        elif event_type == EVENT_IO:
-            if is_proxy:
-                url = f"ContentMgmt/IOProxy/{slug}/{io_port_id}"
-            else:
-                url = f"System/IO/{slug}/{io_port_id}"
-        elif event_type == EVENT_PIR:
-            # ISAPI/WLAlarm/PIR
-            url = slug
-        else:
-            url = f"Smart/{slug}/{channel_id}"
-        return url
+        return urls[is_proxy].format(channel_id=channel_id, io_port_id=io_port_id)
 
     async def get_camera_streams(self, channel_id: int) -> list[CameraStreamInfo]:
         """Get stream info for all cameras."""
+        # all stream types are probed at once, unsupported ones respond with an error
+        responses = await asyncio.gather(
+            *(self.request(GET, f"Streaming/channels/{channel_id}0{stream_type_id}") for stream_type_id in STREAM_TYPE)
+        )
         streams = []
-        for stream_type_id, stream_type in STREAM_TYPE.items():
-            stream_id = f"{channel_id}0{stream_type_id}"
-            stream_info = (await self.request(GET, f"Streaming/channels/{stream_id}")).get("StreamingChannel")
+        for (stream_type_id, stream_type), response in zip(STREAM_TYPE.items(), responses):
+            stream_info = response.get("StreamingChannel")
             if not stream_info:
                 continue
             streams.append(
@@ -379,13 +418,7 @@ class ISAPIClient:
 
     def get_camera_by_id(self, camera_id: int) -> IPCamera | AnalogCamera | None:
         """Get camera object by id."""
-        try:
-            if camera_id == 0:
-                return None
-            return [camera for camera in self.cameras if camera.id == camera_id][0]
-        except IndexError:
-            # Camera id does not exist
-            return None
+        return self._cameras_by_id.get(camera_id)
 
     def get_camera_by_serial_no(self, serial_no: str) -> IPCamera | AnalogCamera | None:
         """Get camera object by serial number."""
@@ -456,15 +489,7 @@ class ISAPIClient:
 
     def _get_event_state_node(self, event: EventInfo) -> str:
         """Get xml key for event state."""
-        slug = EVENTS[event.id]["slug"]
-
-        # Alternate node name for some event types
-        if event.is_proxy and (proxied_node := EVENTS[event.id].get("proxied_node")):
-            slug = proxied_node
-        if not event.is_proxy and (direct_node := EVENTS[event.id].get("direct_node")):
-            slug = direct_node
-
-        return slug[0].upper() + slug[1:]
+        return EVENT_STATE_NODES[event.id][event.is_proxy]
 
     async def get_event_enabled_state(self, event: EventInfo) -> bool:
         """Get event detection state."""
@@ -479,13 +504,11 @@ class ISAPIClient:
         """Get if event is mutually exclusive with enabled events."""
         mutex_issues = []
 
-        if not EVENTS[event.id].get("mutex"):
+        if event.id not in MUTEX_EVENTS:
             return mutex_issues
 
         # Use alt event ID for mutex due to crap API!
-        event_id = event.id
-        if MUTEX_ALTERNATE_ID.get(event.id):
-            event_id = MUTEX_ALTERNATE_ID[event.id]
+        event_id = MUTEX_ALTERNATE_ID.get(event.id, event.id)
 
         data = {"function": event_id, "channelID": int(channel_id)}
         url = "System/mutexFunction?format=json"
@@ -497,8 +520,7 @@ class ISAPIClient:
         if mutex_list := response.get("MutexFunctionList"):
             for mutex_item in mutex_list:
                 mutex_event_id = mutex_item.get("mutexFunction")
-                if EVENTS_ALTERNATE_ID.get(mutex_event_id):
-                    mutex_event_id = EVENTS_ALTERNATE_ID[mutex_event_id]
+                mutex_event_id = EVENTS_ALTERNATE_ID.get(mutex_event_id, mutex_event_id)
 
                 mutex_issues.append(
                     MutexIssue(
@@ -656,30 +678,34 @@ class ISAPIClient:
         # Fix for some cameras sending non html encoded data
         xml = xml.replace("&", "&amp;")
 
-        data = xmltodict.parse(xml)
-        alert = data["EventNotificationAlert"]
+        # only a few fields are needed, read them straight from the element tree, namespace agnostic
+        alert = ElementTree.fromstring(xml)
 
-        event_id = alert.get("eventType")
+        event_id = find_text(alert, "eventType")
         if not event_id or event_id == "duration":
             # <EventNotificationAlert version="2.0"
-            event_id = alert["DurationList"]["Duration"]["relationEvent"]
+            event_id = find_text(alert, "DurationList.Duration.relationEvent")
         event_id = event_id.lower()
 
         # handle alternate event type
-        if EVENTS_ALTERNATE_ID.get(event_id):
-            event_id = EVENTS_ALTERNATE_ID[event_id]
+        event_id = EVENTS_ALTERNATE_ID.get(event_id, event_id)
 
-        channel_id = int(alert.get("channelID", alert.get("dynChannelID", 0)))
-        io_port_id = int(alert.get("inputIOPortID", 0))
+        channel_id = int(find_text(alert, "channelID") or find_text(alert, "dynChannelID") or 0)
+        io_port_id = int(find_text(alert, "inputIOPortID") or 0)
         # <EventNotificationAlert version="1.0"
-        device_serial = deep_get(alert, "Extensions.serialNumber.#text")
+        device_serial = find_text(alert, "Extensions.serialNumber")
         # <EventNotificationAlert version="2.0"
-        mac = alert.get("macAddress")
+        mac = find_text(alert, "macAddress")
 
-        detection_target = deep_get(alert, "DetectionRegionList.DetectionRegionEntry.detectionTarget")
-        region_id = int(deep_get(alert, "DetectionRegionList.DetectionRegionEntry.regionID", 0))
+        detection_target = None
+        region_id = 0
+        # region details are reported only when the event relates to a single region
+        regions = alert.findall("{*}DetectionRegionList/{*}DetectionRegionEntry")
+        if len(regions) == 1:
+            detection_target = find_text(regions[0], "detectionTarget")
+            region_id = int(find_text(regions[0], "regionID") or 0)
 
-        if not EVENTS[event_id]:
+        if event_id not in EVENTS:
             raise ValueError(f"Unsupported event {event_id}")
 
         return AlertInfo(
@@ -698,7 +724,7 @@ class ISAPIClient:
         width: int | None = None,
         height: int | None = None,
         attempt: int = 0,
-    ):
+    ) -> bytes | None:
         """Get camera snapshot."""
         params = {}
         if not width or width > 100:
@@ -709,12 +735,9 @@ class ISAPIClient:
 
         if stream.use_alternate_picture_url:
             url = f"ContentMgmt/StreamingProxy/channels/{stream.id}/picture"
-            full_url = self.get_isapi_url(url)
-            chunks = self.request_bytes(GET, full_url, params=params)
         else:
             url = f"Streaming/channels/{stream.id}/picture"
-            full_url = self.get_isapi_url(url)
-            chunks = self.request_bytes(GET, full_url, params=params)
+        chunks = self.request_bytes(GET, self.get_isapi_url(url), params=params, timeout=self.slow_timeout)
         data = b"".join([chunk async for chunk in chunks])
 
         if data.startswith(b"<?xml "):
@@ -727,6 +750,9 @@ class ISAPIClient:
             if status_code == 3 and attempt < 2:
                 # handle 'Device Error', try again
                 return await self.get_camera_image(stream, width, height, attempt + 1)
+            # error response is not an image
+            _LOGGER.debug("Failed to get snapshot %s | status code %s", url, status_code)
+            return None
 
         return data
 
@@ -740,11 +766,20 @@ class ISAPIClient:
     async def _detect_auth_method(self):
         """Establish the connection with device."""
         if not self._session:
-            self._session = httpx.AsyncClient(timeout=self.timeout, verify=self.verify_ssl)
+            # dedicated client when used outside Home Assistant, keep connections alive between requests
+            self._session = httpx.AsyncClient(
+                timeout=self.timeout,
+                verify=self.verify_ssl,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONCURRENT_REQUESTS,
+                    max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                    keepalive_expiry=30.0,
+                ),
+            )
 
         url = urljoin(self.host, self.isapi_prefix + "/System/deviceInfo")
         _LOGGER.debug("--- [WWW-Authenticate detection] %s", self.host)
-        response = await self._session.get(url)
+        response = await self._session.get(url, timeout=self.timeout)
         if response.status_code == 401:
             www_authenticate = response.headers.get("WWW-Authenticate", "")
             _LOGGER.debug("WWW-Authenticate header: %s", www_authenticate)
@@ -758,6 +793,15 @@ class ISAPIClient:
             if response.headers:
                 _LOGGER.error("response.headers %s", response.headers)
 
+    async def ensure_auth_method(self):
+        """Detect authentication method once if not known yet."""
+        if self._auth_method:
+            return
+        async with self._auth_lock:
+            if not self._auth_method:
+                async with self._request_limit:
+                    await self._detect_auth_method()
+
     def get_isapi_url(self, relative_url: str) -> str:
         """Build full ISAPI URL."""
         return f"{self.host}/{self.isapi_prefix}/{relative_url}"
@@ -768,20 +812,21 @@ class ISAPIClient:
         url: str,
         present: str = "dict",
         data: str = None,
+        timeout: httpx.Timeout | None = None,
     ) -> Any:
         """Send ISAPI request and log response, returns {} if request fails."""
         full_url = self.get_isapi_url(url)
         try:
-            if not self._auth_method:
-                await self._detect_auth_method()
-
-            response = await self._session.request(
-                method,
-                full_url,
-                auth=self._auth_method,
-                data=data,
-                timeout=self.timeout,
-            )
+            await self.ensure_auth_method()
+
+            async with self._request_limit:
+                response = await self._session.request(
+                    method,
+                    full_url,
+                    auth=self._auth_method,
+                    data=data,
+                    timeout=timeout or self.timeout,
+                )
             response.raise_for_status()
             result = parse_isapi_response(response, present)
             _LOGGER.debug("--- [%s] %s", method, full_url)
@@ -810,10 +855,12 @@ class ISAPIClient:
         """Send ISAPI request for binary data."""
 
         try:
-            if not self._auth_method:
-                await self._detect_auth_method()
+            await self.ensure_auth_method()
 
-            async with self._session.stream(method, full_url, auth=self._auth_method, **data) as response:
+            async with (
+                self._request_limit,
+                self._session.stream(method, full_url, auth=self._auth_method, **data) as response,
+            ):
                 async for chunk in response.aiter_bytes():
                     yield chunk
         except httpx.HTTPError as ex:
@@ -827,8 +874,8 @@ class ISAPISetEventStateMutexError(Exception):
         """Initialize exception."""
         self.event = event
         self.mutex_issues = mutex_issues
-        self.message = f"""You cannot enable {EVENTS[event.id]['label']} events.
-            Please disable {EVENTS[mutex_issues[0].event_id]['label']}
+        self.message = f"""You cannot enable {EVENTS[event.id].label} events.
+            Please disable {EVENTS[mutex_issues[0].event_id].label}
             on channels {mutex_issues[0].channels} first"""
 
 
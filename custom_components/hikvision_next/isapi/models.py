@@ -12,7 +12,7 @@ class AlarmServer:
     protocol_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertInfo:
     """Holds NVR/Camera event notification info."""
 
@@ -33,7 +33,7 @@ class MutexIssue:
     channels: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EventInfo:
     """Holds event info of Hikvision device."""
 
@@ -47,7 +47,7 @@ class EventInfo:
     notifications: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraStreamInfo:
     """Holds info of a camera stream."""
 
@@ -1,6 +1,6 @@
 from functools import reduce
-import json
 from typing import Any
+from xml.etree.ElementTree import Element
 
 import xmltodict
 
@@ -15,13 +15,10 @@ def parse_isapi_response(response, present="dict"):
         result = response.text
 
     if present is None or present == "dict":
+        # parse straight into plain dicts, no need to convert them afterwards
         if isinstance(response, (list,)):
-            events = []
-            for event in response:
-                e = json.loads(json.dumps(xmltodict.parse(event)))
-                events.append(e)
-            return events
-        return json.loads(json.dumps(xmltodict.parse(result)))
+            return [xmltodict.parse(event, dict_constructor=dict) for event in response]
+        return xmltodict.parse(result, dict_constructor=dict)
     else:
         return result
 
@@ -54,3 +51,9 @@ def deep_get(dictionary: dict, path: str, default: Any = None) -> Any:
         return [result]
 
     return result
+
+
+def find_text(element: Element, path: str) -> str | None:
+    """Get stripped text of nested xml element regardless of namespace."""
+    value = element.findtext("/".join(f"{{*}}{tag}" for tag in path.split(".")))
+    return (value.strip() or None) if value else None
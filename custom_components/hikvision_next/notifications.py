@@ -12,10 +12,9 @@ from aiohttp import web
 from requests_toolbelt.multipart import MultipartDecoder
 
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.const import CONTENT_TYPE_TEXT_PLAIN, STATE_ON, Platform
+from homeassistant.const import CONTENT_TYPE_TEXT_PLAIN, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_registry import async_get
-from homeassistant.util import slugify
 
 from .const import ALARM_SERVER_PATH, DOMAIN, HIKVISION_EVENT
 from .hikvision_device import HikvisionDevice
@@ -171,23 +170,22 @@ class EventNotificationsView(HomeAssistantView):
 
         _LOGGER.debug("Alert: %s", alert)
 
-        serial_no = self.device.device_info.serial_no.lower()
-
         device_id_param = f"_{alert.channel_id}" if alert.channel_id != 0 and alert.event_id != EVENT_IO else ""
         io_port_id_param = f"_{alert.io_port_id}" if alert.io_port_id != 0 else ""
-        unique_id = f"binary_sensor.{slugify(serial_no)}{device_id_param}{io_port_id_param}_{alert.event_id}"
+        unique_id = f"binary_sensor.{self.device.serial_no_slug}{device_id_param}{io_port_id_param}_{alert.event_id}"
 
         _LOGGER.debug("UNIQUE_ID: %s", unique_id)
 
+        if sensor := self.device.event_sensors.get(unique_id):
+            sensor.trigger()
+            self.fire_hass_event(alert)
+            return
+
+        # disabled sensor is registered but not added to hass
         entity_registry = async_get(self.hass)
-        entity_id = entity_registry.async_get_entity_id(Platform.BINARY_SENSOR, DOMAIN, unique_id)
-        if entity_id:
-            entity = self.hass.states.get(entity_id)
-            if entity:
-                self.hass.states.async_set(entity_id, STATE_ON, entity.attributes)
-                self.fire_hass_event(alert)
+        if entity_registry.async_get_entity_id(Platform.BINARY_SENSOR, DOMAIN, unique_id):
             return
-        raise ValueError(f"Entity not found {entity_id}")
+        raise ValueError(f"Entity not found {unique_id}")
 
     def fire_hass_event(self, alert: AlertInfo):
         """Fire HASS event."""
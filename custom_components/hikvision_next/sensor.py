@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from homeassistant.components.sensor import ENTITY_ID_FORMAT, SensorEntity
+from homeassistant.components.sensor import SensorEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -38,7 +38,8 @@ async def async_setup_entry(
         for item in list(device.storage):
             entities.append(StorageSensor(coordinator, item))
 
-        async_add_entities(entities, True)
+        # state comes from the coordinator, its first refresh runs in background
+        async_add_entities(entities)
 
 
 class AlarmServerSensor(CoordinatorEntity, SensorEntity):
@@ -53,7 +54,7 @@ class AlarmServerSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         device = coordinator.device
         self._attr_unique_id = f"{device.device_info.serial_no}_{CONF_ALARM_SERVER_HOST}_{key}"
-        self.entity_id = ENTITY_ID_FORMAT.format(self.unique_id)
+        self.entity_id = f"sensor.{self.unique_id}"
         self._attr_device_info = device.hass_device_info()
         self._attr_translation_key = f"notifications_host_{key}"
         self.key = key
@@ -62,7 +63,7 @@ class AlarmServerSensor(CoordinatorEntity, SensorEntity):
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
         host = self.coordinator.data.get(CONF_ALARM_SERVER_HOST)
-        return host.get(self.key)
+        return host.get(self.key) if host else None
 
 
 class StorageSensor(CoordinatorEntity, SensorEntity):
@@ -77,7 +78,7 @@ class StorageSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         device = coordinator.device
         self._attr_unique_id = f"{device.device_info.serial_no}_{hdd.id}_{hdd.name}"
-        self.entity_id = ENTITY_ID_FORMAT.format(self.unique_id)
+        self.entity_id = f"sensor.{self.unique_id}"
         self._attr_device_info = device.hass_device_info()
         self._attr_name = f"{hdd.type} {hdd.name}"
         self.hdd = hdd
@@ -76,6 +76,22 @@ async def test_camera_snapshot_device_error(hass: HomeAssistant, init_integratio
     assert image == b"binary image data"
 
 
+@respx.mock
+@pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
+async def test_camera_snapshot_persistent_error(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
+    """Test camera snapshot is not returned when device keeps responding with error."""
+
+    entity_id = "camera.ds_7608nxi_i0_0p_s0000000000ccrrj00000000wcvu_101"
+    camera_entity = get_camera_from_entity_id(hass, entity_id)
+
+    image_url = f"{TEST_HOST}/ISAPI/Streaming/channels/101/picture"
+    error_response = load_fixture("ISAPI/Streaming.channels.x0y.picture", "deviceError")
+    route = respx.get(image_url).respond(content=error_response)
+    image = await camera_entity.async_camera_image()
+    assert image is None
+    assert route.call_count == 3
+
+
 @respx.mock
 @pytest.mark.parametrize("init_integration", ["DS-7616NI-Q2"], indirect=True)
 async def test_camera_snapshot_alternate_url(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
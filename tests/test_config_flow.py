@@ -88,7 +88,7 @@ async def test_unexpeced_exception_config_flow(get_device_info_mock, hass, mock_
     get_device_info_mock.side_effect = Exception("Something went wrong")
     result = await hass.config_entries.flow.async_configure(result["flow_id"], user_input=TEST_CONFIG)
     assert result.get("type") == FlowResultType.FORM
-    assert result.get("errors") == {"base": "Unexpected Exception: Something went wrong"}
+    assert result.get("errors") == {"base": "unknown"}
 
 
 @pytest.mark.parametrize("mock_isapi_device", ["DS-2CD2386G2-IU"], indirect=True)
@@ -110,6 +110,23 @@ async def test_user_input_validation(hass, mock_isapi_device):
     assert result["data"] == TEST_CONFIG
 
 
+@patch("custom_components.hikvision_next.isapi.ISAPIClient.get_device_info")
+@pytest.mark.parametrize(
+    "host",
+    ["http://", "192.168.1.100", "ftp://192.168.1.100", "http://host:abc", "http://host:99999", "http://[::1"],
+)
+async def test_invalid_host_config_flow(get_device_info_mock, hass, mock_isapi, host):
+    """Test a config flow with malformed device address."""
+
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+
+    user_input = {**TEST_CONFIG, CONF_HOST: host}
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], user_input=user_input)
+    assert result.get("type") == FlowResultType.FORM
+    assert result.get("errors") == {"base": "invalid_host"}
+    get_device_info_mock.assert_not_called()
+
+
 @pytest.mark.parametrize("mock_isapi_device", [("DS-2CD2386G2-IU", TEST_CONFIG_OUTSIDE_NETWORK['host'])], indirect=True)
 async def test_user_input_validation_with_rtsp_port(hass, mock_isapi_device):
     """Test a successful config flow."""
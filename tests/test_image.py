@@ -0,0 +1,49 @@
+"""Tests for image platform."""
+
+import os
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.components.image.const import DATA_COMPONENT
+from homeassistant.const import ATTR_ENTITY_ID, CONF_FILENAME
+from custom_components.hikvision_next.const import ACTION_UPDATE_SNAPSHOT, DOMAIN
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+
+@pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
+async def test_snapshot_file(hass: HomeAssistant, init_integration: MockConfigEntry, tmp_path) -> None:
+    """Test snapshot file is read again only when it changes."""
+
+    entity_id = "image.ds_7608nxi_i0_0p_s0000000000ccrrj00000000wcvu_101_snapshot"
+    snapshot_file = tmp_path / "snapshot.jpg"
+    snapshot_file.write_bytes(b"first image")
+
+    await hass.services.async_call(
+        DOMAIN,
+        ACTION_UPDATE_SNAPSHOT,
+        {ATTR_ENTITY_ID: entity_id, CONF_FILENAME: str(snapshot_file)},
+        blocking=True,
+    )
+    image_entity = hass.data[DATA_COMPONENT].get_entity(entity_id)
+    assert await image_entity.async_image() == b"first image"
+    assert await image_entity.async_image() == b"first image"
+
+    snapshot_file.write_bytes(b"second image")
+    stat = snapshot_file.stat()
+    os.utime(snapshot_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert await image_entity.async_image() == b"second image"
+
+    # overwritten with unchanged mtime, the service call makes the file read again
+    stat = snapshot_file.stat()
+    snapshot_file.write_bytes(b"third  image")
+    os.utime(snapshot_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    await hass.services.async_call(
+        DOMAIN,
+        ACTION_UPDATE_SNAPSHOT,
+        {ATTR_ENTITY_ID: entity_id, CONF_FILENAME: str(snapshot_file)},
+        blocking=True,
+    )
+    assert await image_entity.async_image() == b"third  image"
+
+    snapshot_file.unlink()
+    assert await image_entity.async_image() is None
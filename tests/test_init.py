@@ -1,14 +1,15 @@
 """Tests for the hikvision_next integration."""
 
 import pytest
+import respx
 from unittest.mock import patch
 from homeassistant.core import HomeAssistant
-from custom_components.hikvision_next.const import DOMAIN
+from custom_components.hikvision_next.const import DOMAIN, SECONDARY_COORDINATOR
 from custom_components.hikvision_next.hikvision_device import HikvisionDevice
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 from homeassistant.config_entries import ConfigEntryState
 
-from tests.conftest import TEST_CONFIG, TEST_CONFIG_WITH_ALARM_SERVER, TEST_CONFIG_OUTSIDE_NETWORK
+from tests.conftest import TEST_CONFIG, TEST_CONFIG_WITH_ALARM_SERVER, TEST_CONFIG_OUTSIDE_NETWORK, TEST_HOST
 
 
 @pytest.mark.parametrize("init_integration",
@@ -147,6 +148,26 @@ async def test_async_setup_entry_nvr_with_alarm_server(hass: HomeAssistant, init
         assert not hass.data.get(DOMAIN)
 
 
+@pytest.mark.parametrize("init_integration", [("DS-2CD2386G2-IU", True)], indirect=True)
+async def test_async_setup_entry_without_secondary_data(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
+    """Test setup of device without holiday mode, alarm server and storage."""
+
+    entry = init_integration
+
+    with (
+        patch.object(HikvisionDevice, "get_alarm_server", return_value=None),
+        patch.object(HikvisionDevice, "get_storage_devices", return_value=[]),
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert entry.state == ConfigEntryState.LOADED
+        device = entry.runtime_data
+        assert not device.capabilities.support_holiday_mode
+        assert not device.capabilities.support_alarm_server
+        assert SECONDARY_COORDINATOR not in device.coordinators
+
+
 @pytest.mark.parametrize("mock_isapi", [TEST_CONFIG_OUTSIDE_NETWORK['host']], indirect=True)
 @pytest.mark.parametrize("mock_config_entry", [TEST_CONFIG_OUTSIDE_NETWORK], indirect=True)
 @pytest.mark.parametrize("init_integration", [("DS-2CD2T86G2-ISU")], indirect=True)
@@ -188,3 +209,26 @@ async def test_async_setup_entry_nvr_outside_network(hass: HomeAssistant, init_i
     await hass.async_block_till_done()
 
     assert not hass.data.get(DOMAIN)
+
+
+@pytest.mark.parametrize("init_integration", ["DS-2CD2386G2-IU"], indirect=True)
+async def test_notifications_view_registered_once(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
+    """Test event notifications view is not registered again on reload."""
+
+    entry = init_integration
+    assert entry.state == ConfigEntryState.LOADED
+
+    with patch.object(hass.http, "register_view") as register_view_mock:
+        await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert entry.state == ConfigEntryState.LOADED
+        register_view_mock.assert_not_called()
+
+
+@pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
+async def test_secondary_data_fetched_once_on_setup(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
+    """Test holidays are fetched only by the background coordinator refresh."""
+
+    assert init_integration.state == ConfigEntryState.LOADED
+    assert respx.get(f"{TEST_HOST}/ISAPI/System/Holidays").call_count == 1
@@ -1,11 +1,14 @@
 """Test event notifications."""
 
 import pytest
+from datetime import timedelta
+from freezegun.api import FrozenDateTimeFactory
 from http import HTTPStatus
 from homeassistant.core import HomeAssistant, Event
+from custom_components.hikvision_next.binary_sensor import ALERT_RESET_DELAY
 from custom_components.hikvision_next.notifications import EventNotificationsView
 from custom_components.hikvision_next.const import HIKVISION_EVENT, RTSP_PORT_FORCED
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 from unittest.mock import MagicMock
 from tests.conftest import load_fixture, TEST_HOST_IP, TEST_CONFIG, TEST_CONFIG_OUTSIDE_NETWORK
 from homeassistant.const import (
@@ -234,3 +237,29 @@ async def test_nvr_and_cam_notification_alert(
     assert sensor_cam_2.state == STATE_OFF
     assert sensor_cam_3.state == STATE_ON
     assert sensor_nvr_1.state == STATE_ON
+
+
+@pytest.mark.parametrize("init_integration", ["DS-2CD2386G2-IU"], indirect=True)
+async def test_alert_sensor_reset(
+    hass: HomeAssistant, init_integration: MockConfigEntry, freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test sensor turns off after last of repeated alerts."""
+
+    entity_id = "binary_sensor.ds_2cd2386g2_iu00000000aawrj00000000_1_fielddetection"
+    view = EventNotificationsView(hass)
+
+    await view.post(mock_event_notification("ipc_1_fielddetection"))
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    freezer.tick(timedelta(seconds=ALERT_RESET_DELAY - 1))
+    await view.post(mock_event_notification("ipc_1_fielddetection"))
+
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    freezer.tick(timedelta(seconds=ALERT_RESET_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_OFF
@@ -4,7 +4,8 @@ import respx
 import pytest
 import httpx
 from homeassistant.core import HomeAssistant
-from custom_components.hikvision_next.isapi.const import EVENT_IO
+from custom_components.hikvision_next.const import CONF_ALARM_SERVER_HOST, EVENTS_COORDINATOR, HOLIDAY_MODE, SECONDARY_COORDINATOR
+from custom_components.hikvision_next.isapi.const import EVENT_IO, GET
 from custom_components.hikvision_next.hikvision_device import HikvisionDevice
 from tests.conftest import TEST_HOST
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
@@ -208,3 +209,56 @@ async def test_ipc_multichannel_event_switch(
     ]
     for entity_id in switch_entities:
         assert hass.states.get(entity_id)
+
+
+@pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
+async def test_event_switch_state_after_token_expired(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+) -> None:
+    """Test events state is fetched again with renewed authorization after token expiration."""
+
+    entity_id = "switch.ds_7608nxi_i0_0p_s0000000000ccrrj00000000wcvu_1_videoloss"
+    device: HikvisionDevice = init_integration.runtime_data
+
+    url = f"{TEST_HOST}/ISAPI/ContentMgmt/InputProxy/channels/1/video/videoLoss"
+    payload = '<?xml version="1.0" encoding="utf-8"?>\n<VideoLoss version="2.0" xmlns="http://www.isapi.org/ver20/XMLSchema"><enabled>false</enabled></VideoLoss>'
+    endpoint = respx.get(url).mock(side_effect=[httpx.Response(401), httpx.Response(200, text=payload)])
+    endpoint.reset()
+
+    await device.coordinators[EVENTS_COORDINATOR].async_refresh()
+    await hass.async_block_till_done()
+
+    assert endpoint.call_count == 2
+    assert hass.states.get(entity_id).state == STATE_OFF
+    assert not device.auth_token_expired
+    assert not hass.config_entries.flow.async_progress()
+
+
+@pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
+async def test_secondary_state_after_token_expired(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+) -> None:
+    """Test concurrent secondary requests renew authorization once and do not start reauth."""
+
+    device: HikvisionDevice = init_integration.runtime_data
+    coordinator = device.coordinators[SECONDARY_COORDINATOR]
+
+    endpoints = []
+    for path in ("System/Holidays", "Event/notification/httpHosts"):
+        payload = await device.request(GET, path, present="xml")
+        endpoint = respx.get(f"{TEST_HOST}/ISAPI/{path}").mock(
+            side_effect=[httpx.Response(401), httpx.Response(200, text=payload)]
+        )
+        endpoint.reset()
+        endpoints.append(endpoint)
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert [endpoint.call_count for endpoint in endpoints] == [2, 2]
+    assert HOLIDAY_MODE in coordinator.data
+    assert CONF_ALARM_SERVER_HOST in coordinator.data
+    assert not device.auth_token_expired
+    assert not hass.config_entries.flow.async_progress()